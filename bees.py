@@ -0,0 +1,212 @@
+import numpy as np
+from buzzness import Bee, build_index
+from collections import Counter
+from typing import List, Optional, Tuple
+
+
+# --- Structure-of-Arrays Helpers ---
+def bee_positions(blist: List[Bee]) -> np.ndarray:
+    """Gather all bee positions into a single array.
+
+    Args:
+        blist (List[Bee]): List of Bee objects.
+
+    Returns:
+        np.ndarray: (N, 2) int16 array of (x, y) positions, one row per bee.
+    """
+    pos = np.empty((len(blist), 2), dtype=np.int16)
+    for i, b in enumerate(blist):
+        pos[i] = b.get_pos()
+    return pos
+
+
+def bee_inhive_mask(blist: List[Bee]) -> np.ndarray:
+    """Gather the in-hive flags of all bees into a boolean mask.
+
+    Args:
+        blist (List[Bee]): List of Bee objects.
+
+    Returns:
+        np.ndarray: (N,) boolean array, True where the bee is inside the hive.
+    """
+    return np.fromiter(
+        (b.get_inhive() for b in blist), dtype=bool, count=len(blist)
+    )
+
+
+# --- Structure-of-Arrays Swarm Bookkeeping ---
+class BeeSwarm:
+    """Structure-of-arrays view of a colony's scalar vital state.
+
+    Gathers age, energy, wait and alive state from a list of Bee objects so
+    the per-timestep bookkeeping (aging, energy drain, death, hive waiting)
+    can run as a handful of vectorized array operations instead of one
+    Python pass per bee.
+
+    Attributes:
+        age (np.ndarray): Age of each bee in timesteps.
+        energy (np.ndarray): Energy level of each bee.
+        wait_steps (np.ndarray): Remaining hive wait timesteps per bee.
+        lifespan (np.ndarray): Maximum age per bee.
+        alive (np.ndarray): Boolean liveness flags.
+    """
+
+    __slots__ = ("blist", "age", "energy", "wait_steps", "lifespan", "alive")
+
+    def __init__(self, blist: List[Bee]):
+        """Gather vital-state arrays from the given bees."""
+        self.blist = blist
+        n = len(blist)
+        # Ages, energy (<= 100 plus a small recharge), wait steps and
+        # lifespans all fit comfortably in a signed byte
+        self.age = np.fromiter((b.age for b in blist), dtype=np.int8, count=n)
+        self.energy = np.fromiter((b.energy for b in blist), dtype=np.int8, count=n)
+        self.wait_steps = np.fromiter(
+            (b.wait_steps for b in blist), dtype=np.int8, count=n
+        )
+        self.lifespan = np.fromiter(
+            (b.lifespan for b in blist), dtype=np.int8, count=n
+        )
+        self.alive = np.fromiter((b.alive for b in blist), dtype=bool, count=n)
+
+    def update_vitals(self) -> np.ndarray:
+        """Apply aging, energy drain, death and hive waiting for all bees.
+
+        Mirrors the bookkeeping at the top of Bee.step_change as boolean-mask
+        array updates over the whole colony.
+
+        Returns:
+            np.ndarray: Boolean mask of bees that survived, are not waiting,
+                and should run their behavior step this timestep.
+        """
+        # Boolean masks act as 0/1 operands here, so each update is one
+        # in-place sweep over the arrays instead of a fancy-index gather
+        # plus scatter per stage
+        live = self.alive
+        self.energy -= live
+        self.age += live
+        # Bees die when energy runs out or lifespan is reached
+        died = live & ((self.energy <= 0) | (self.age >= self.lifespan))
+        self.alive &= ~died
+        # Waiting bees recharge energy and sit this timestep out
+        waiting = self.alive & (self.wait_steps > 0)
+        self.wait_steps -= waiting
+        recharged = np.minimum(self.energy + 5, 100).astype(np.int8)
+        np.copyto(self.energy, recharged, where=waiting)
+        return self.alive & ~waiting
+
+    def write_back(self) -> None:
+        """Scatter the updated vital state back onto the Bee objects."""
+        # tolist() converts each array to plain Python scalars in one C
+        # call, so the loop assigns ints directly instead of boxing a
+        # NumPy scalar per bee per field
+        ages = self.age.tolist()
+        energies = self.energy.tolist()
+        waits = self.wait_steps.tolist()
+        alives = self.alive.tolist()
+        for i, b in enumerate(self.blist):
+            b.age = ages[i]
+            b.energy = energies[i]
+            b.wait_steps = waits[i]
+            b.alive = alives[i]
+
+
+# --- Batch Step ---
+def step_all_bees(
+    blist: List[Bee],
+    world: np.ndarray,
+    hive_pos: Tuple[int, int],
+    flowers: list,
+    trees: list,
+    barriers: list,
+    comm_prob: float,
+    strategy_type: str,
+    hive_memory: set,
+    source_xy: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Advance every bee by one timestep in a single batch call.
+
+    Collects the nectar deposited by each bee into one array so the caller
+    can update the hive and honey totals without per-bee Python bookkeeping.
+
+    Args:
+        blist (List[Bee]): List of Bee objects to advance.
+        world (np.ndarray): World grid with terrain markers.
+        hive_pos (Tuple[int, int]): Position of the hive.
+        flowers (list): List of flowers in the world.
+        trees (list): List of trees in the world.
+        barriers (list): List of barriers in the world.
+        comm_prob (float): Probability of sharing nectar locations.
+        strategy_type (str): Strategy for movement ('none', 'random', 'intelligent').
+        hive_memory (set): Shared nectar locations for the intelligent strategy.
+        source_xy (Optional[np.ndarray]): Optional (S, 2) array of flower and tree
+            coordinates, used to precompute which bees are adjacent to a
+            nectar source so the others can skip their 3x3 scan.
+
+    Returns:
+        np.ndarray: (N,) int32 array of nectar deposited by each bee this step.
+    """
+    nectars = np.zeros(len(blist), dtype=np.int32)
+    pos = bee_positions(blist)
+
+    # Vectorized collection precheck: only bees that are outside the hive
+    # and not carrying nectar run the 3x3 scan, so the Chebyshev adjacency
+    # test (source within one cell in both axes) is broadcast over just
+    # that subset instead of the whole colony
+    near = None
+    if source_xy is not None and len(source_xy) > 0:
+        searching = np.fromiter(
+            (not b.inhive and b.carrying_nectar == 0 for b in blist),
+            dtype=bool, count=len(blist)
+        )
+        near = np.zeros(len(blist), dtype=bool)
+        if searching.any():
+            dist = np.abs(
+                pos[searching, None, :] - source_xy[None, :, :]
+            ).max(axis=2)
+            near[searching] = (dist <= 1).any(axis=1)
+
+    # Step bees in 8x8 tile order so neighbours in the same patch of the
+    # world grid are processed back to back while those cells are cached
+    order = np.lexsort((pos[:, 1] // 8, pos[:, 0] // 8))
+
+    # Build the spatial index once and share it across the whole colony
+    index = build_index(
+        flowers, trees, barriers, (len(world), len(world[0])), hive_pos
+    )
+
+    # Apply the colony-wide vital bookkeeping in one vectorized pass
+    swarm = BeeSwarm(blist)
+    active = swarm.update_vitals()
+    swarm.write_back()
+
+    # Count targets once per tick for the intelligent strategy; each bee
+    # updates the shared count as it claims a target
+    target_counts = None
+    if strategy_type == 'intelligent':
+        target_counts = Counter(
+            b.target for b in blist if b.alive and b.target is not None
+        )
+
+    # Advance each active bee and record its deposited nectar; the
+    # inactive ones are filtered out with one mask application instead
+    # of a per-iteration check inside the loop
+    for i in order[active[order]].tolist():
+        b = blist[i]
+        nectars[i] = b.step_change(
+            None,
+            world,
+            hive_pos,
+            flowers,
+            trees,
+            barriers,
+            comm_prob,
+            strategy_type,
+            hive_memory,
+            blist,
+            near_source=bool(near[i]) if near is not None else None,
+            index=index,
+            vitals_done=True,
+            target_counts=target_counts
+        )
+    return nectars
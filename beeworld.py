@@ -1,10 +1,25 @@
-import random
+import copy
 import argparse
-import csv
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+import matplotlib
+if '-i' not in sys.argv and '--interactive' not in sys.argv:
+    # Batch mode never shows a window; the Agg backend skips GUI event-loop
+    # startup and makes savefig the fast path
+    matplotlib.use('Agg')
 import matplotlib.pyplot as plt
+from matplotlib.collections import PathCollection
 import numpy as np
-from buzzness import Bee, Flower, Tree, Barrier
-from typing import List, Tuple
+import pandas as pd
+
+# World grid dimensions are fixed for every run and sweep configuration;
+# keeping them as module constants lets the loaders and bounds checks
+# specialize on one shape instead of re-deriving it per call
+WORLD_X, WORLD_Y = 40, 35
+from buzzness import Bee, Flower, Tree, Barrier, seed_rng
+from bees import bee_positions, bee_inhive_mask, step_all_bees
+from typing import List, Optional, Tuple
 
 # --- Command-Line Argument Parsing ---
 def parse_arguments() -> argparse.Namespace:
@@ -37,35 +52,52 @@ def load_map(
     """
     # Initialize empty lists for terrain objects
     flowers, trees, barriers = [], [], []
-    # Create a 40x35 world grid, where each cell represents a terrain type
-    world = np.zeros((40, 35), dtype=int)
-
-    # Read the map file and process each row
-    with open(mapfile, 'r') as f:
-        reader = csv.reader(f)
-        next(reader)  # Skip the header row
-        for row in reader:
-            x, y = int(row[1]), int(row[2])
-            # Skip positions outside the world boundaries
-            if x >= 40 or y >= 35 or x < 0 or y < 0:
-                continue
-            # Create Flower objects and mark their positions
-            if row[0] == 'flower':
-                flowers.append(Flower((x, y), row[3], row[4], nectar_amount))
-                world[x, y] = 1  # Mark as flower (1)
-            # Create Tree objects with associated flowers
-            elif row[0] == 'tree':
-                tree_flowers = [
-                    Flower((x, y), f"flower_{i}", "red", nectar_amount)
-                    for i in range(3)
-                ]
-                trees.append(Tree((x, y), tree_flowers))
-                world[x, y] = 2  # Mark as tree (2)
-            # Create Barrier objects (water or building)
-            elif row[0] in ['water', 'building']:
-                barriers.append(Barrier((x, y), row[0]))
-                # Mark as water (3) or building (4)
-                world[x, y] = 3 if row[0] == 'water' else 4
+    # Create the world grid, where each cell represents a terrain type;
+    # codes fit in a byte, so int8 keeps the grid cache-resident
+    world = np.zeros((WORLD_X, WORLD_Y), dtype=np.int8)
+
+    # Parse the map file in one pass with pandas' C engine; typing the
+    # coordinate columns up front skips dtype inference
+    df = pd.read_csv(mapfile, engine='c', dtype={'x': np.int16, 'y': np.int16})
+    # Drop positions outside the world boundaries
+    df = df[
+        (df['x'] >= 0) & (df['x'] < WORLD_X) & (df['y'] >= 0) & (df['y'] < WORLD_Y)
+    ]
+
+    # Create Flower objects and mark their positions in one fancy-indexed
+    # store; tolist() yields plain Python scalars column-wise, cheaper
+    # than building a namedtuple per row
+    flower_rows = df[df['type'] == 'flower']
+    flowers = [
+        Flower((x, y), name, color, nectar_amount)
+        for x, y, name, color in zip(
+            flower_rows['x'].tolist(), flower_rows['y'].tolist(),
+            flower_rows['name'].tolist(), flower_rows['color'].tolist()
+        )
+    ]
+    world[flower_rows['x'].to_numpy(), flower_rows['y'].to_numpy()] = 1
+
+    # Create Tree objects with associated flowers
+    tree_rows = df[df['type'] == 'tree']
+    trees = [
+        Tree((x, y), Flower.bulk_create(3, (x, y), nectar_amount))
+        for x, y in zip(tree_rows['x'].tolist(), tree_rows['y'].tolist())
+    ]
+    world[tree_rows['x'].to_numpy(), tree_rows['y'].to_numpy()] = 2
+
+    # Create Barrier objects (water or building)
+    barrier_rows = df[df['type'].isin(['water', 'building'])]
+    barriers = [
+        Barrier((x, y), btype)
+        for x, y, btype in zip(
+            barrier_rows['x'].tolist(), barrier_rows['y'].tolist(),
+            barrier_rows['type'].tolist()
+        )
+    ]
+    # Mark as water (3) or building (4)
+    world[barrier_rows['x'].to_numpy(), barrier_rows['y'].to_numpy()] = np.where(
+        barrier_rows['type'].to_numpy() == 'water', 3, 4
+    )
 
     return flowers, trees, barriers, world
 
@@ -88,28 +120,27 @@ def load_parameters(paramfile: str) -> dict:
     valid_strategies = ['none', 'random', 'intelligent']
 
     try:
-        with open(paramfile, 'r') as f:
-            reader = csv.reader(f)
-            next(reader)  # Skip the header row
-            for row in reader:
-                # Handle communication probability (float between 0 and 1)
-                if row[0] == 'comm_prob':
-                    params[row[0]] = float(row[1])
-                    if not (0.0 <= params[row[0]] <= 1.0):
-                        raise ValueError(f"Invalid comm_prob: {params[row[0]]}")
-                # Validate strategy type
-                elif row[0] == 'strategy_type':
-                    if row[1] not in valid_strategies:
-                        raise ValueError(
-                            f"Invalid strategy_type: {row[1]}, must be one of {valid_strategies}"
-                        )
-                    params[row[0]] = row[1]
-                # Handle other parameters (integers or strings)
-                else:
-                    params[row[0]] = int(row[1]) if row[1].isdigit() else row[1]
-                # Ensure numeric parameters are non-negative
-                if isinstance(params[row[0]], (int, float)) and params[row[0]] < 0:
-                    raise ValueError(f"Invalid parameter {row[0]}: {params[row[0]]}")
+        # Parse the whole file at once; keep values as strings for validation
+        df = pd.read_csv(paramfile, engine='c', dtype=str)
+        for name, value in df.itertuples(index=False):
+            # Handle communication probability (float between 0 and 1)
+            if name == 'comm_prob':
+                params[name] = float(value)
+                if not (0.0 <= params[name] <= 1.0):
+                    raise ValueError(f"Invalid comm_prob: {params[name]}")
+            # Validate strategy type
+            elif name == 'strategy_type':
+                if value not in valid_strategies:
+                    raise ValueError(
+                        f"Invalid strategy_type: {value}, must be one of {valid_strategies}"
+                    )
+                params[name] = value
+            # Handle other parameters (integers or strings)
+            else:
+                params[name] = int(value) if value.isdigit() else value
+            # Ensure numeric parameters are non-negative
+            if isinstance(params[name], (int, float)) and params[name] < 0:
+                raise ValueError(f"Invalid parameter {name}: {params[name]}")
     except FileNotFoundError:
         print(f"Error: {paramfile} not found")
         exit(1)
@@ -118,29 +149,51 @@ def load_parameters(paramfile: str) -> dict:
 
 
 # --- Hive Visualization ---
+def make_hive_display(hive: np.ndarray) -> np.ndarray:
+    """Build the static comb display array matching the hive's shape.
+
+    Args:
+        hive (np.ndarray): 2D array representing the hive's state.
+
+    Returns:
+        np.ndarray: Display array with the comb stripe and honey cells set.
+    """
+    hive_display = np.zeros_like(hive)
+    hive_display[:, 10:15:2] = 5  # Full honey cells
+    hive_display[:, 11:15:2] = 10  # Comb cells (not ready)
+    return hive_display
+
+
 def plot_hive(
-    hive: List[List[int]], blist: List[Bee], ax: plt.Axes, bees_only: bool = False
-) -> None:
+    hive: List[List[int]],
+    pos: np.ndarray,
+    inhive: np.ndarray,
+    ax: plt.Axes,
+    bees_only: bool = False,
+    hive_display: Optional[np.ndarray] = None
+) -> PathCollection:
     """Plot the hive view with bees and comb structure.
 
     Args:
         hive (List[List[int]]): 2D array representing the hive's state.
-        blist (List[Bee]): List of Bee objects to plot.
+        pos (np.ndarray): (N, 2) array of bee positions.
+        inhive (np.ndarray): Boolean mask of bees currently inside the hive.
         ax (plt.Axes): Matplotlib axes to plot on.
         bees_only (bool): If True, plot only bees (Task 1); otherwise, include comb.
+        hive_display (np.ndarray): Optional precomputed comb display array,
+            reused across frames to avoid reallocating it every plot.
+
+    Returns:
+        matplotlib.collections.PathCollection: The bee scatter artist, so
+            callers can update it in place with set_offsets between frames.
     """
-    # Extract positions of bees inside the hive
-    xvalues = [b.get_pos()[0] for b in blist if b.get_inhive()]
-    yvalues = [b.get_pos()[1] for b in blist if b.get_inhive()]
+    # Select positions of bees inside the hive
+    xvalues = pos[inhive, 0]
+    yvalues = pos[inhive, 1]
 
     if not bees_only:
-        # Create a display array for the hive with comb and honey
-        hive_display = np.zeros_like(hive)
-        hive_display[:, 10:15] = 10  # Set center stripe as comb (not ready)
-        # Add alternating honey cells in the comb
-        for i in range(len(hive)):
-            for j in range(10, 15, 2):
-                hive_display[i, j] = 5  # Full honey cells
+        if hive_display is None:
+            hive_display = make_hive_display(hive)
         # Plot the hive with a yellow-orange-brown colormap
         ax.imshow(hive_display.T, cmap='YlOrBr', origin='lower', vmin=0, vmax=10)
         # Add a vertical dashed line to indicate comb boundary
@@ -153,27 +206,37 @@ def plot_hive(
         ax.set_title('Bees in Hive (Task 1)')
 
     # Scatter plot bees as yellow circles
-    ax.scatter(xvalues, yvalues, c='yellow', marker='o', label='Bees')
+    bee_scatter = ax.scatter(xvalues, yvalues, c='yellow', marker='o', label='Bees')
     ax.set_xlabel('X Position')
     ax.set_ylabel('Y Position')
     ax.legend()
+    return bee_scatter
 
 
 # --- World Visualization ---
 def plot_world(
-    world: List[List[int]], blist: List[Bee], hive_pos: Tuple[int, int], ax: plt.Axes
-) -> None:
+    world: List[List[int]],
+    pos: np.ndarray,
+    inhive: np.ndarray,
+    hive_pos: Tuple[int, int],
+    ax: plt.Axes
+) -> PathCollection:
     """Plot the world view with terrain, bees, and hive.
 
     Args:
         world (List[List[int]]): 2D array representing the world grid.
-        blist (List[Bee]): List of Bee objects to plot.
+        pos (np.ndarray): (N, 2) array of bee positions.
+        inhive (np.ndarray): Boolean mask of bees currently inside the hive.
         hive_pos (Tuple[int, int]): Position of the hive.
         ax (plt.Axes): Matplotlib axes to plot on.
+
+    Returns:
+        matplotlib.collections.PathCollection: The bee scatter artist, so
+            callers can update it in place with set_offsets between frames.
     """
-    # Extract positions of bees outside the hive
-    xvalues = [b.get_pos()[0] for b in blist if not b.get_inhive()]
-    yvalues = [b.get_pos()[1] for b in blist if not b.get_inhive()]
+    # Select positions of bees outside the hive
+    xvalues = pos[~inhive, 0]
+    yvalues = pos[~inhive, 1]
 
     # Define a custom colormap for terrain types
     custom_cmap = plt.cm.colors.ListedColormap(
@@ -190,17 +253,26 @@ def plot_world(
     ax.scatter(hive_pos[0], hive_pos[1], c='orange', marker='o', s=20)
 
     # Plot bees as yellow circles
-    ax.scatter(xvalues, yvalues, c='yellow', marker='o', label='Bees')
+    bee_scatter = ax.scatter(xvalues, yvalues, c='yellow', marker='o', label='Bees')
     ax.set_title('Property')
     ax.set_xlabel('X Position')
     ax.set_ylabel('Y Position')
     ax.legend()
+    return bee_scatter
 
 
 # --- Hive Initialization ---
+# Cached comb template, rebuilt only when a new hive shape is requested;
+# sweep runs reset the hive dozens of times with the same dimensions
+_hive_template = None
+
+
 def initialize_hive(hive_x: int, hive_y: int) -> np.ndarray:
     """Initialize the hive grid with a comb pattern.
 
+    Repeated calls with the same dimensions (every sweep iteration) copy
+    from a cached template instead of repainting the comb pattern.
+
     Args:
         hive_x (int): Width of the hive grid.
         hive_y (int): Height of the hive grid.
@@ -208,14 +280,19 @@ def initialize_hive(hive_x: int, hive_y: int) -> np.ndarray:
     Returns:
         np.ndarray: 2D array representing the initialized hive.
     """
-    # Create a hive grid with specified dimensions
-    hive = np.zeros((hive_x, hive_y), dtype=int)
-    hive[:, 10:15] = 10  # Set center stripe as comb (not ready for honey)
-    # Add alternating honey cells in the comb
-    for i in range(hive_x):
-        for j in range(10, 15, 2):
-            hive[i, j] = 5  # Set to full honey (max value)
-    return hive
+    global _hive_template
+    if _hive_template is None or _hive_template.shape != (hive_x, hive_y):
+        # Create a hive grid with specified dimensions; honey levels are 0-10
+        hive = np.zeros((hive_x, hive_y), dtype=np.int8)
+        # Two disjoint strided stores paint the comb stripe: even columns of
+        # the stripe hold honey cells (5), odd ones comb (10), so no cell is
+        # written twice
+        hive[:, 10:15:2] = 5  # Full honey cells (max value)
+        hive[:, 11:15:2] = 10  # Comb cells (not ready for honey)
+        _hive_template = hive
+    out = np.empty_like(_hive_template)
+    np.copyto(out, _hive_template)
+    return out
 
 
 # --- Simulation Class ---
@@ -232,7 +309,7 @@ class Simulation:
         nectar_amount (int): Initial nectar per flower.
         comm_prob (float): Probability of bees sharing nectar locations.
         strategy_type (str): Strategy for bee movement ('none', 'random', 'intelligent').
-        hive_memory (List): Shared nectar locations for intelligent strategy.
+        hive_memory (Set): Shared nectar locations for intelligent strategy.
     """
 
     def __init__(
@@ -245,9 +322,15 @@ class Simulation:
         hive_pos: Tuple[int, int],
         nectar_amount: int,
         comm_prob: float,
-        strategy_type: str
+        strategy_type: str,
+        terrain: Tuple[List[Flower], List[Tree], List[Barrier], np.ndarray] = None
     ):
-        """Initialize the simulation with given parameters."""
+        """Initialize the simulation with given parameters.
+
+        Args:
+            terrain: Optional preloaded (flowers, trees, barriers, world) tuple
+                from load_map, reused across runs instead of re-parsing mapfile.
+        """
         self.num_bees = num_bees
         self.sim_length = sim_length
         self.mapfile = mapfile
@@ -257,57 +340,95 @@ class Simulation:
         self.nectar_amount = nectar_amount
         self.comm_prob = comm_prob
         self.strategy_type = strategy_type
-        self.hive_memory = []  # Shared memory for intelligent strategy
+        self.terrain = terrain  # Preloaded terrain shared across runs
+        self.hive_memory = set()  # Shared memory for intelligent strategy
         self.reset()
 
     def reset(self) -> None:
         """Reset the simulation state before a new run."""
+        # Derive the bee module's private RNG stream and NumPy's from the
+        # global one, so random.seed(n) before a run keeps every draw
+        # (including the np.random bee placement below) reproducible
+        seed_rng()
+        np.random.seed(random.getrandbits(32))
         # Initialize hive and load terrain
         self.hive = initialize_hive(self.hive_x, self.hive_y)
-        self.flowers, self.trees, self.barriers, self.world = load_map(
-            self.mapfile, self.nectar_amount
-        )
-        # Create bees with random positions inside the hive
-        self.blist = [
-            Bee(
-                f"b{i}",
-                (random.randint(0, self.hive_x - 1), random.randint(0, self.hive_y - 1))
+        if self.terrain is not None:
+            # Copy the cached terrain instead of re-parsing the map file,
+            # then refill nectar for this run's configured amount
+            base_flowers, base_trees, base_barriers, base_world = self.terrain
+            self.flowers = copy.deepcopy(base_flowers)
+            self.trees = copy.deepcopy(base_trees)
+            self.barriers = list(base_barriers)
+            self.world = base_world.copy()
+            for f in self.flowers:
+                f.nectar = self.nectar_amount
+            for t in self.trees:
+                for f in t.flowers:
+                    f.nectar = self.nectar_amount
+        else:
+            self.flowers, self.trees, self.barriers, self.world = load_map(
+                self.mapfile, self.nectar_amount
             )
+        # Create bees with random positions inside the hive, drawing all
+        # coordinates in two batched RNG calls instead of 2N Python calls
+        xs = np.random.randint(0, self.hive_x, self.num_bees)
+        ys = np.random.randint(0, self.hive_y, self.num_bees)
+        # Recycle last run's bees through the pool before acquiring
+        for bee in getattr(self, 'blist', []):
+            bee.release()
+        self.blist = [
+            Bee.acquire(f"b{i}", (int(xs[i]), int(ys[i])))
             for i in range(self.num_bees)
         ]
+        # Cache nectar source coordinates as one structure-of-arrays
+        # block for vectorized adjacency prechecks in the batch step;
+        # int16 matches the bee position arrays so the Chebyshev
+        # subtraction stays in the narrow dtype
+        self.source_xy = np.array(
+            [f.position for f in self.flowers] + [t.position for t in self.trees],
+            dtype=np.int16
+        ).reshape(-1, 2)
         self.total_honey = 0
-        self.honey_over_time = []
-        self.hive_memory = []
+        # Preallocate one slot per timestep instead of growing a list
+        self.honey_over_time = np.zeros(self.sim_length, dtype=np.int32)
+        self.hive_memory = set()
+        # Static comb display never changes; build it once per run
+        self.hive_display = make_hive_display(self.hive)
 
-    def run(self, interactive: bool = False) -> Tuple[int, List[int]]:
+    def run(self, interactive: bool = False) -> Tuple[int, np.ndarray]:
         """Run the simulation for the specified number of timesteps.
 
         Args:
             interactive (bool): If True, enable interactive visualization.
 
         Returns:
-            Tuple[int, List[int]]: Total honey collected and honey per timestep.
+            Tuple[int, np.ndarray]: Total honey collected and honey per timestep.
         """
         if interactive:
             plt.ion()  # Enable interactive plotting mode
 
+            # Gather bee position arrays once for the initial plots
+            pos = bee_positions(self.blist)
+            inhive = bee_inhive_mask(self.blist)
+
             # Task 1: Plot bees only in the hive
             fig1, ax1 = plt.subplots(figsize=(6, 5))
-            plot_hive(self.hive, self.blist, ax1, bees_only=True)
+            plot_hive(self.hive, pos, inhive, ax1, bees_only=True)
             fig1.savefig('task1.png')
             plt.close(fig1)
 
             # Task 2: Plot hive with comb in two columns
             fig2, axes2 = plt.subplots(1, 2, figsize=(12, 5))
-            plot_hive(self.hive, self.blist, axes2[0])
-            plot_hive(self.hive, self.blist, axes2[1])
+            plot_hive(self.hive, pos, inhive, axes2[0], hive_display=self.hive_display)
+            plot_hive(self.hive, pos, inhive, axes2[1], hive_display=self.hive_display)
             fig2.suptitle('Hive Simulation (Task 2)')
             fig2.savefig('task2.png')
             plt.close(fig2)
 
             # Task 3: Plot the initial world state
             fig3, ax3 = plt.subplots(figsize=(6, 5))
-            plot_world(self.world, self.blist, self.hive_pos, ax3)
+            plot_world(self.world, pos, inhive, self.hive_pos, ax3)
             fig3.savefig('task3.png')
             plt.close(fig3)
 
@@ -322,47 +443,66 @@ class Simulation:
 
             fig4.canvas.mpl_connect('key_press_event', on_key)
 
+            # Create the Task 4 artists once; frames update them in place
+            hive_scatter = plot_hive(
+                self.hive, pos, inhive, axes4[0], hive_display=self.hive_display
+            )
+            world_scatter = plot_world(
+                self.world, pos, inhive, self.hive_pos, axes4[1]
+            )
+
         # Run simulation for each timestep
         for t in range(self.sim_length):
             if interactive and paused:
                 plt.pause(0.1)  # Pause visualization if toggled
                 continue
 
-            # Update each bee and track honey collected in this timestep
-            timestep_honey = 0
-            for b in self.blist:
-                nectar = b.step_change(
-                    None,
-                    self.world,
-                    self.hive_pos,
-                    self.flowers,
-                    self.trees,
-                    self.barriers,
-                    self.comm_prob,
-                    self.strategy_type,
-                    self.hive_memory,
-                    self.blist
-                )
-                timestep_honey += nectar
-                # Deposit nectar in the hive if bee is inside
-                if b.get_inhive():
-                    x, y = min(b.get_pos()[0], self.hive_x - 1), min(
-                        b.get_pos()[1], self.hive_y - 1
-                    )
-                    self.hive[x, y] = min(self.hive[x, y] + nectar, 5)
+            # Advance all bees in one batch call and track honey per timestep
+            nectars = step_all_bees(
+                self.blist,
+                self.world,
+                self.hive_pos,
+                self.flowers,
+                self.trees,
+                self.barriers,
+                self.comm_prob,
+                self.strategy_type,
+                self.hive_memory,
+                source_xy=self.source_xy
+            )
+            timestep_honey = int(nectars.sum())
+
+            # Gather bee arrays once per timestep; reused by deposit and plots
+            pos = bee_positions(self.blist)
+            mask_inhive = bee_inhive_mask(self.blist)
+
+            # Deposit nectar for all in-hive bees in one vectorized update
+            mask = mask_inhive & (nectars > 0)
+            if mask.any():
+                xs = np.minimum(pos[mask, 0], self.hive_x - 1)
+                ys = np.minimum(pos[mask, 1], self.hive_y - 1)
+                # Accumulate in int16 so many bees on one cell cannot
+                # overflow the int8 hive before the clamp is applied
+                deposit = np.zeros(self.hive.shape, dtype=np.int16)
+                np.add.at(deposit, (xs, ys), nectars[mask])
+                touched = deposit > 0
+                # Clamp only the touched cells so untouched comb keeps its value
+                self.hive[touched] = np.minimum(
+                    self.hive[touched] + deposit[touched], 5
+                ).astype(np.int8)
 
             self.total_honey += timestep_honey
-            self.honey_over_time.append(timestep_honey)
+            self.honey_over_time[t] = timestep_honey
 
             # Update interactive visualization
             if interactive:
                 fig4.suptitle(
                     f'Bee Simulation - Timestep {t}, Strategy: {self.strategy_type}'
                 )
-                axes4[0].clear()
-                axes4[1].clear()
-                plot_hive(self.hive, self.blist, axes4[0])
-                plot_world(self.world, self.blist, self.hive_pos, axes4[1])
+                # Update the existing scatter artists instead of replotting
+                hive_scatter.set_offsets(pos[mask_inhive])
+                world_scatter.set_offsets(pos[~mask_inhive])
+                fig4.canvas.draw_idle()
                 if t == self.sim_length - 1:
                     fig4.savefig('task4.png')
                 plt.pause(1)
@@ -384,12 +524,67 @@ class Simulation:
 
 
 # --- Parameter Sweep for Batch Mode ---
-def run_parameter_sweep(mapfile: str, paramfile: str) -> None:
+# Per-process terrain cache so each worker parses the map file at most once
+_terrain_cache = {}
+
+
+def _run_one(args: Tuple) -> Tuple[int, int, str, int, float, float]:
+    """Run a single sweep configuration and return its metrics row.
+
+    Top-level so it can be dispatched to worker processes by the executor.
+
+    Args:
+        args (Tuple): (num_bees, sim_length, mapfile, hive_x, hive_y,
+            hive_pos, nectar_amount, comm_prob, strategy_type).
+
+    Returns:
+        Tuple: (num_bees, nectar_amount, strategy_type, total_honey,
+            avg_honey_per_bee, success_rate).
+    """
+    (num_bees, sim_length, mapfile, hive_x, hive_y, hive_pos,
+     nectar_amount, comm_prob, strategy_type) = args
+    terrain = _terrain_cache.get(mapfile)
+    if terrain is None:
+        terrain = _terrain_cache.setdefault(mapfile, load_map(mapfile, 0))
+    sim = Simulation(
+        num_bees,
+        sim_length,
+        mapfile,
+        hive_x,
+        hive_y,
+        hive_pos,
+        nectar_amount,
+        comm_prob,
+        strategy_type,
+        terrain=terrain
+    )
+    total_honey, _ = sim.run()
+    # Calculate metrics for this run
+    avg_honey_per_bee = total_honey / num_bees if num_bees > 0 else 0
+    success_rate = sum(
+        1 for b in sim.blist if b.carrying_nectar > 0 or b.total_nectar > 0
+    ) / num_bees if num_bees > 0 else 0
+    return (
+        num_bees,
+        nectar_amount,
+        strategy_type,
+        total_honey,
+        avg_honey_per_bee,
+        success_rate
+    )
+
+
+
+def run_parameter_sweep(mapfile: str, paramfile: str) -> pd.DataFrame:
     """Run multiple simulations with varying parameters and save results.
 
     Args:
         mapfile (str): Path to the terrain map file.
         paramfile (str): Path to the parameters file.
+
+    Returns:
+        pd.DataFrame: Sweep results, one row per configuration, so callers
+            can reuse them without re-reading the results CSV.
     """
     # Load parameters and set defaults
     params = load_parameters(paramfile)
@@ -397,39 +592,39 @@ def run_parameter_sweep(mapfile: str, paramfile: str) -> None:
     comm_prob = params.get('comm_prob', 0.7)
     hive_x, hive_y = 30, 25
     hive_pos = (20, 20)
-    results = []
-
-    # Sweep over different numbers of bees, nectar amounts, and strategies
-    for num_bees in [5, 10, 15]:
-        for nectar_amount in [50, 100, 200]:
-            for strategy_type in ['none', 'random', 'intelligent']:
-                sim = Simulation(
-                    num_bees,
-                    sim_length,
-                    mapfile,
-                    hive_x,
-                    hive_y,
-                    hive_pos,
-                    nectar_amount,
-                    comm_prob,
-                    strategy_type
-                )
-                total_honey, _ = sim.run()
-                # Calculate metrics for this run
-                avg_honey_per_bee = total_honey / num_bees if num_bees > 0 else 0
-                success_rate = sum(
-                    1 for b in sim.blist if b.carrying_nectar > 0 or b.total_nectar > 0
-                ) / num_bees if num_bees > 0 else 0
-                results.append(
-                    (
-                        num_bees,
-                        nectar_amount,
-                        strategy_type,
-                        total_honey,
-                        avg_honey_per_bee,
-                        success_rate
-                    )
-                )
+
+    # Build the argument list for every bees/nectar/strategy combination
+    arg_list = [
+        (num_bees, sim_length, mapfile, hive_x, hive_y, hive_pos,
+         nectar_amount, comm_prob, strategy_type)
+        for num_bees in [5, 10, 15]
+        for nectar_amount in [50, 100, 200]
+        for strategy_type in ['none', 'random', 'intelligent']
+    ]
+
+    # Run the independent simulations in parallel across worker processes.
+    # Submitting the biggest colonies first keeps the workers evenly
+    # loaded at the tail of the sweep; the result rows are reordered back
+    # to the original configuration order afterwards
+    schedule = sorted(range(len(arg_list)), key=lambda i: -arg_list[i][0])
+    with ProcessPoolExecutor() as executor:
+        mapped = list(executor.map(_run_one, [arg_list[i] for i in schedule]))
+    results = [None] * len(arg_list)
+    for slot, res in zip(schedule, mapped):
+        results[slot] = res
+
+    # Collect results into a DataFrame for grouped reporting and plotting
+    df = pd.DataFrame(
+        results,
+        columns=[
+            'num_bees',
+            'nectar_amount',
+            'strategy_type',
+            'total_honey',
+            'avg_honey_per_bee',
+            'success_rate'
+        ]
+    )
 
     # Print parameter sweep results
     print("Parameter Sweep Results:")
@@ -443,35 +638,18 @@ def run_parameter_sweep(mapfile: str, paramfile: str) -> None:
             f"{avg_honey:<14.2f} {success_rate:<12.2f}"
         )
 
-    # Save results to CSV
-    with open('parameter_sweep_results.csv', 'w', newline='') as f:
-        writer = csv.writer(f)
-        writer.writerow(
-            [
-                'num_bees',
-                'nectar_amount',
-                'strategy_type',
-                'total_honey',
-                'avg_honey_per_bee',
-                'success_rate'
-            ]
-        )
-        for row in results:
-            writer.writerow(row)
+    # Save results to CSV through pandas' C writer
+    df.to_csv('parameter_sweep_results.csv', index=False)
 
-    # Plot honey collected vs. number of bees for each strategy
+    # Plot honey collected vs. number of bees for each strategy/nectar group
     plt.figure(figsize=(10, 6))
-    for strategy in ['none', 'random', 'intelligent']:
-        for na in [50, 100, 200]:
-            bees = [r[0] for r in results if r[2] == strategy and r[1] == na]
-            honey = [r[3] for r in results if r[2] == strategy and r[1] == na]
-            if bees:
-                plt.plot(
-                    bees,
-                    honey,
-                    marker='o',
-                    label=f'{strategy}, Nectar={na}'
-                )
+    for (strategy, na), group in df.groupby(['strategy_type', 'nectar_amount']):
+        plt.plot(
+            group['num_bees'],
+            group['total_honey'],
+            marker='o',
+            label=f'{strategy}, Nectar={na}'
+        )
     plt.title('Honey Collected vs. Number of Bees by Strategy')
     plt.xlabel('Number of Bees')
     plt.ylabel('Total Honey')
@@ -483,19 +661,21 @@ def run_parameter_sweep(mapfile: str, paramfile: str) -> None:
     # Print summary report averaging metrics by strategy and nectar amount
     print("Summary Report:")
     print(f"{'Strategy':<12} {'Nectar':<8} {'Avg Honey/Bee':<14} {'Success Rate':<12}")
-    for strategy in ['none', 'random', 'intelligent']:
-        for na in [50, 100, 200]:
-            avg_honey = [
-                r[4] for r in results if r[2] == strategy and r[1] == na
-            ]
-            success = [
-                r[5] for r in results if r[2] == strategy and r[1] == na
-            ]
-            if avg_honey:
-                print(
-                    f"{strategy:<12} {na:<8} {sum(avg_honey)/len(avg_honey):<14.2f} "
-                    f"{sum(success)/len(success):<12.2f}"
-                )
+    summary = df.pivot_table(
+        index=['strategy_type', 'nectar_amount'],
+        values=['avg_honey_per_bee', 'success_rate'],
+        aggfunc='mean'
+    )
+    # Keep the baseline none/random/intelligent report order rather than
+    # the pivot's alphabetical one, so sweep logs stay diffable
+    summary = summary.reindex(['none', 'random', 'intelligent'], level=0)
+    for (strategy, na), row in summary.iterrows():
+        print(
+            f"{strategy:<12} {na:<8} {row['avg_honey_per_bee']:<14.2f} "
+            f"{row['success_rate']:<12.2f}"
+        )
+
+    return df
 
 
 # --- Main Execution ---
@@ -506,7 +686,7 @@ def main() -> None:
 
     # Set default simulation parameters
     hive_x, hive_y = 30, 25
-    world_x, world_y = 40, 35
+    world_x, world_y = WORLD_X, WORLD_Y
     sim_length = 10
     num_bees = 5
     mapfile = 'map1.csv'
@@ -546,57 +726,9 @@ def main() -> None:
         comm_prob = params.get('comm_prob', comm_prob)
         nectar_amount = params.get('nectar_amount', nectar_amount)
         strategy_type = params.get('strategy_type', strategy_type)
+        # The sweep already plotted and summarized; keep the returned frame
+        # in case callers extend batch mode, instead of re-reading the CSV
         run_parameter_sweep(mapfile, paramfile)
-
-        # Replot results for confirmation
-        try:
-            with open('parameter_sweep_results.csv', 'r') as f:
-                reader = csv.reader(f)
-                next(reader)
-                results = [
-                    (int(row[0]), int(row[1]), row[2], int(row[3]), float(row[4]), float(row[5]))
-                    for row in reader
-                ]
-            plt.figure(figsize=(10, 6))
-            for strategy in ['none', 'random', 'intelligent']:
-                for na in [50, 100, 200]:
-                    bees = [r[0] for r in results if r[2] == strategy and r[1] == na]
-                    honey = [r[3] for r in results if r[2] == strategy and r[1] == na]
-                    if bees:
-                        plt.plot(
-                            bees,
-                            honey,
-                            marker='o',
-                            label=f'{strategy}, Nectar={na}'
-                        )
-            plt.title('Honey Collected vs. Number of Bees by Strategy')
-            plt.xlabel('Number of Bees')
-            plt.ylabel('Total Honey')
-            plt.legend()
-            plt.grid(True)
-            plt.savefig('parameter_sweep_plot.png')
-            plt.close()
-
-            # Print summary report
-            print("Summary Report:")
-            print(
-                f"{'Strategy':<12} {'Nectar':<8} {'Avg Honey/Bee':<14} {'Success Rate':<12}"
-            )
-            for strategy in ['none', 'random', 'intelligent']:
-                for na in [50, 100, 200]:
-                    avg_honey = [
-                        r[4] for r in results if r[2] == strategy and r[1] == na
-                    ]
-                    success = [
-                        r[5] for r in results if r[2] == strategy and r[1] == na
-                    ]
-                    if avg_honey:
-                        print(
-                            f"{strategy:<12} {na:<8} {sum(avg_honey)/len(avg_honey):<14.2f} "
-                            f"{sum(success)/len(success):<12.2f}"
-                        )
-        except FileNotFoundError:
-            print("Error: parameter_sweep_results.csv not found")
         return
     else:
         print("Error: Specify -i for interactive mode or -f and -p for batch mode")
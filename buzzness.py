@@ -1,10 +1,33 @@
+import logging
 import random
+from collections import Counter
 from dataclasses import dataclass
-from typing import Tuple, List, Optional
+from enum import IntEnum
+from typing import Tuple, List, Optional, Set
+
+import numpy as np
+
+log = logging.getLogger(__name__)
+
+# Dedicated RNG instance: bound methods on a local Random skip the
+# module-level dispatch that random.random()/choice() go through
+_rng = random.Random()
+
+
+def seed_rng(a=None) -> None:
+    """Seed the module's private RNG.
+
+    Args:
+        a: Seed value, as accepted by random.seed. When None, the seed is
+            drawn from the global random stream, so a prior random.seed(n)
+            makes every draw in a run reproducible, as it did when this
+            module used the global functions directly.
+    """
+    _rng.seed(random.getrandbits(64) if a is None else a)
 
 
 # --- Flower Class ---
-@dataclass
+@dataclass(slots=True)
 class Flower:
     """Represents a flower with nectar in the simulation.
 
@@ -20,6 +43,23 @@ class Flower:
     color: str
     nectar: int  # Initial nectar amount
 
+    @classmethod
+    def bulk_create(
+        cls, n: int, position: Tuple[int, int], nectar: int, color: str = "red"
+    ) -> List['Flower']:
+        """Create n flowers at one position in a single comprehension.
+
+        Args:
+            n (int): Number of flowers to create.
+            position (Tuple[int, int]): (x, y) coordinates shared by all flowers.
+            nectar (int): Initial nectar amount per flower.
+            color (str): Color shared by all flowers.
+
+        Returns:
+            List[Flower]: The newly created flowers.
+        """
+        return [cls(position, f"flower_{i}", color, nectar) for i in range(n)]
+
     def collect_nectar(self) -> int:
         """Collect nectar from the flower if available.
 
@@ -37,7 +77,7 @@ class Flower:
 
 
 # --- Tree Class ---
-@dataclass
+@dataclass(slots=True)
 class Tree:
     """Represents a tree grouping multiple flowers.
 
@@ -63,7 +103,7 @@ class Tree:
 
 
 # --- Barrier Class ---
-@dataclass
+@dataclass(slots=True)
 class Barrier:
     """Represents a barrier (e.g., water, building) that bees cannot cross.
 
@@ -76,13 +116,144 @@ class Barrier:
     type: str  # e.g., 'water', 'building'
 
 
+# Moore-neighborhood offsets (excluding the current position), shared by all
+# bees so no per-step candidate list needs to be built
+_MOORE = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+
+# Scan order for the 3x3 nectar search, matching the original nested
+# dx/dy loops (row-major including the bee's own cell)
+_MOORE_INCL_CENTER = (
+    (-1, -1), (-1, 0), (-1, 1),
+    (0, -1), (0, 0), (0, 1),
+    (1, -1), (1, 0), (1, 1)
+)
+
+
+def _sign(v: int) -> int:
+    """Return the sign of v (-1, 0, or 1) without branching."""
+    return (v > 0) - (v < 0)
+
+
+# Terrain bit flags: one uint8 cell encodes everything present there, so a
+# neighbor query is a single byte read and mask test
+FLOWER = 1 << 0
+TREE = 1 << 1
+BARRIER = 1 << 2
+HIVE = 1 << 3
+_SOURCE = FLOWER | TREE
+
+
+# --- Spatial Index ---
+# The maps below are keyed by exact cell, which is the degenerate (cell
+# size 1) case of a uniform bucket grid: since bees only ever probe their
+# own 3x3 neighborhood, per-cell buckets make each probe a single dict hit
+# or one byte read in the flags grid, with no within-bucket filtering.
+def build_index(
+    flowers: List[Flower],
+    trees: List[Tree],
+    barriers: List[Barrier],
+    shape: Tuple[int, int],
+    hive_pos: Optional[Tuple[int, int]] = None
+) -> Tuple[dict, dict, np.ndarray]:
+    """Build O(1) position lookups for the terrain objects.
+
+    Args:
+        flowers (List[Flower]): Flowers in the world.
+        trees (List[Tree]): Trees in the world.
+        barriers (List[Barrier]): Barriers in the world.
+        shape (Tuple[int, int]): (width, height) of the world grid.
+        hive_pos (Optional[Tuple[int, int]]): Hive position, flagged in the
+            terrain grid when given.
+
+    Returns:
+        Tuple[dict, dict, np.ndarray]: Position-keyed flower map, tree map,
+            and a uint8 grid whose cells carry the FLOWER/TREE/BARRIER/HIVE
+            bit flags; barrier collision checks read the grid directly.
+            Where several objects share a position the first one wins,
+            matching the old linear-scan order.
+    """
+    flags = np.zeros(shape, dtype=np.uint8)
+    width, height = shape
+    flower_map = {}
+    for f in flowers:
+        flower_map.setdefault(f.position, f)
+        x, y = f.position
+        if 0 <= x < width and 0 <= y < height:
+            flags[x, y] |= FLOWER
+    tree_map = {}
+    for t in trees:
+        tree_map.setdefault(t.position, t)
+        x, y = t.position
+        if 0 <= x < width and 0 <= y < height:
+            flags[x, y] |= TREE
+    for b in barriers:
+        x, y = b.position
+        if 0 <= x < width and 0 <= y < height:
+            flags[x, y] |= BARRIER
+    if hive_pos is not None:
+        flags[hive_pos] |= HIVE
+    return flower_map, tree_map, flags
+
+
+class BeeState(IntEnum):
+    """Behavioral state of a bee, derived from its flags each timestep."""
+
+    IN_HIVE_WAIT = 0
+    IN_HIVE_IDLE = 1
+    OUT_SEARCH = 2
+    OUT_RETURNING = 3
+    OUT_TIMEOUT = 4
+
+
+# --- Strategy Dispatch ---
+def _target_none(bee, comm_prob, hive_memory, blist, target_counts):
+    """No communication: missions always start without a target."""
+    return None
+
+
+def _target_random(bee, comm_prob, hive_memory, blist, target_counts):
+    """Target a known nectar location with probability comm_prob."""
+    if bee.known_nectar and _rng.random() < comm_prob:
+        return _rng.choice(bee.known_nectar)
+    return None
+
+
+def _target_intelligent(bee, comm_prob, hive_memory, blist, target_counts):
+    """Target a shared hive-memory location with fewer than 2 claimants."""
+    if not hive_memory:
+        return None
+    # The caller shares one count per tick; standalone calls count here
+    if target_counts is None:
+        target_counts = Counter(
+            b.target for b in blist if b.alive and b.target is not None
+        )
+    valid_targets = [loc for loc in hive_memory if target_counts[loc] < 2]
+    if not valid_targets:
+        return None
+    target = _rng.choice(valid_targets)
+    # Keep the shared count current for bees that pick their targets
+    # later this same tick
+    target_counts[target] += 1
+    return target
+
+
+# One dict lookup resolves the strategy at mission start, replacing the
+# string-compare chain; unknown strategies fall back to no target
+_STRATEGY_FNS = {
+    'none': _target_none,
+    'random': _target_random,
+    'intelligent': _target_intelligent,
+}
+
+
 # --- Bee Class ---
 class Bee:
     """Represents a worker bee in the simulation with mission-based behavior.
 
     Attributes:
         id (str): Unique identifier for the bee (e.g., 'b1').
-        pos (Tuple[int, int]): Current (x, y) position of the bee.
+        px (int): Current x coordinate of the bee.
+        py (int): Current y coordinate of the bee.
         age (int): Age of the bee in timesteps.
         inhive (bool): Whether the bee is currently in the hive.
         on_mission (bool): Whether the bee is on a nectar collection mission.
@@ -97,6 +268,37 @@ class Bee:
         steps_outside_hive (int): Number of timesteps spent outside the hive.
     """
 
+    __slots__ = (
+        "id", "px", "py", "age", "inhive", "on_mission", "carrying_nectar",
+        "target", "known_nectar", "wait_steps", "energy", "lifespan",
+        "alive", "total_nectar", "steps_outside_hive"
+    )
+
+    # Free list of released bees, shared class-wide so repeated sweep
+    # resets reinitialize old instances instead of allocating new ones
+    _pool: List['Bee'] = []
+
+    @classmethod
+    def acquire(cls, id: str, pos: Tuple[int, int]) -> 'Bee':
+        """Take a bee from the reuse pool, or allocate one if it is empty.
+
+        Args:
+            id (str): Unique identifier for the bee.
+            pos (Tuple[int, int]): Initial (x, y) position in the hive.
+
+        Returns:
+            Bee: A freshly initialized bee.
+        """
+        if cls._pool:
+            bee = cls._pool.pop()
+            bee.__init__(id, pos)
+            return bee
+        return cls(id, pos)
+
+    def release(self) -> None:
+        """Return this bee to the reuse pool for a later acquire."""
+        Bee._pool.append(self)
+
     def __init__(self, id: str, pos: Tuple[int, int]):
         """Initialize a bee with a given ID and starting position.
 
@@ -105,7 +307,7 @@ class Bee:
             pos (Tuple[int, int]): Initial (x, y) position in the hive.
         """
         self.id = id
-        self.pos = pos
+        self.px, self.py = pos
         self.age = 0
         self.inhive = True  # Bee starts in the hive
         self.on_mission = False  # Not on a mission initially
@@ -119,6 +321,20 @@ class Bee:
         self.total_nectar = 0  # Total nectar collected over lifetime
         self.steps_outside_hive = 0  # Track steps outside the hive
 
+    @property
+    def pos(self) -> Tuple[int, int]:
+        """The bee's (x, y) position as a tuple.
+
+        Stored as two plain int fields so the per-tick movement code
+        avoids allocating a tuple per step; this property keeps tuple
+        reads and writes working for existing callers.
+        """
+        return (self.px, self.py)
+
+    @pos.setter
+    def pos(self, value: Tuple[int, int]) -> None:
+        self.px, self.py = value
+
     def step_change(
         self,
         subgrid: Optional[List[List[int]]],
@@ -129,8 +345,12 @@ class Bee:
         barriers: List[Barrier],
         comm_prob: float = 0.7,
         strategy_type: str = 'random',
-        hive_memory: List[Tuple[int, int]] = None,
-        blist: List['Bee'] = None
+        hive_memory: Set[Tuple[int, int]] = None,
+        blist: List['Bee'] = None,
+        near_source: Optional[bool] = None,
+        index: Optional[Tuple[dict, dict, np.ndarray]] = None,
+        vitals_done: bool = False,
+        target_counts: Optional[Counter] = None
     ) -> int:
         """Update the bee's state and position for one timestep.
 
@@ -145,173 +365,258 @@ class Bee:
             barriers (List[Barrier]): List of barriers in the world.
             comm_prob (float): Probability of sharing nectar locations.
             strategy_type (str): Strategy for movement ('none', 'random', 'intelligent').
-            hive_memory (List[Tuple[int, int]]): Shared nectar locations (intelligent strategy).
+            hive_memory (Set[Tuple[int, int]]): Shared nectar locations (intelligent strategy).
             blist (List[Bee]): List of all bees (for intelligent strategy).
+            near_source (Optional[bool]): Precomputed hint for whether any
+                nectar source lies within one cell; False skips the 3x3 scan,
+                None (unknown) scans as usual.
+            index (Optional[Tuple[dict, dict, np.ndarray]]): Prebuilt
+                spatial index from build_index, shared across the colony for
+                one timestep; built on the fly from the lists when not
+                supplied.
+            vitals_done (bool): True when the caller has already applied the
+                aging/energy/wait bookkeeping for this timestep (e.g. via
+                BeeSwarm.update_vitals), so it is not repeated here.
+            target_counts (Optional[Counter]): Per-tick count of live bees
+                per target, shared across the colony and kept current as
+                bees pick targets; counted from blist when not supplied.
 
         Returns:
             int: Amount of nectar deposited in the hive (0 if none).
         """
-        # Skip updates if the bee is not alive
-        if not self.alive:
-            return 0
-
-        # Update energy and lifespan
-        self.energy -= 1  # Deplete energy each timestep
-        self.age += 1
-        if self.energy <= 0 or self.age >= self.lifespan:
-            self.alive = False  # Bee dies if energy or lifespan runs out
-            return 0
-
-        # Handle waiting period in the hive
+        if not vitals_done:
+            # Skip updates if the bee is not alive
+            if not self.alive:
+                return 0
+
+            # Update energy and lifespan
+            self.energy -= 1  # Deplete energy each timestep
+            self.age += 1
+            if self.energy <= 0 or self.age >= self.lifespan:
+                self.alive = False  # Bee dies if energy or lifespan runs out
+                return 0
+
+            # Handle waiting period in the hive
+            if self.wait_steps > 0:
+                self.wait_steps -= 1
+                self.energy = min(self.energy + 5, 100)  # Recharge energy while waiting
+                return 0
+
         deposited_nectar = 0
-        if self.wait_steps > 0:
-            self.wait_steps -= 1
-            self.energy = min(self.energy + 5, 100)  # Recharge energy while waiting
-            return 0
+
+        # Bind the hot RNG method once per call; LOAD_FAST beats the
+        # global + attribute lookup it replaces in the loops below
+        getrandbits = _rng.getrandbits
+
+        # Resolve the behavioral state once, then run exactly one branch
+        state = self._state()
 
         # Handle bee behavior inside the hive
-        if self.inhive:
+        if state <= BeeState.IN_HIVE_IDLE:
             # Start a mission after 4 timesteps
             if self.age >= 4 and not self.on_mission:
                 self.on_mission = True
                 self.inhive = False
                 self.steps_outside_hive = 0  # Reset counter for steps outside
-                # Set target based on strategy type
-                if strategy_type == 'none':
-                    self.target = None  # No target, move randomly
-                elif strategy_type == 'random' and self.known_nectar and random.random() < comm_prob:
-                    # Choose a known nectar location with probability comm_prob
-                    self.target = random.choice(self.known_nectar)
-                elif strategy_type == 'intelligent' and hive_memory:
-                    # Choose a target with fewer than 2 bees already targeting it
-                    valid_targets = [
-                        loc for loc in hive_memory
-                        if sum(1 for b in blist if b.target == loc and b.alive) < 2
-                    ]
-                    self.target = random.choice(valid_targets) if valid_targets else None
-                else:
-                    self.target = None
-                # Decay known nectar locations (max 5, 90% retention chance)
+                # Set target based on strategy type, resolved through the
+                # dispatch table instead of a string-compare chain
+                self.target = _STRATEGY_FNS.get(strategy_type, _target_none)(
+                    self, comm_prob, hive_memory, blist, target_counts
+                )
+                # Decay known nectar locations (max 5, ~90% retention
+                # chance per entry). One getrandbits call yields a byte
+                # per entry (keep when byte < 230, i.e. 230/256), and the
+                # list is only rebuilt when an entry actually drops out
                 if self.known_nectar:
-                    self.known_nectar = [
-                        loc for loc in self.known_nectar if random.random() < 0.9
-                    ][:5]
+                    known = self.known_nectar[:5]
+                    bits = getrandbits(8 * len(known))
+                    kept = [
+                        loc for i, loc in enumerate(known)
+                        if (bits >> (8 * i)) & 0xFF < 230
+                    ]
+                    if len(kept) < len(self.known_nectar):
+                        self.known_nectar = kept
             else:
                 self.age += 1  # Increment age while in hive
                 return 0
         # Handle bee behavior outside the hive
         else:
+            # Hoist world bounds once; they are reread up to 16 times below
+            width, height = len(world), len(world[0])
+
+            # Build the spatial index here if the caller did not share one
+            if index is None:
+                index = build_index(flowers, trees, barriers, (width, height))
+            flower_map, tree_map, flags = index
+
             self.steps_outside_hive += 1  # Increment steps outside counter
-            # Define possible moves in a 3x3 Moore neighborhood (excluding current position)
-            valid_moves = [
-                (dx, dy) for dx in [-1, 0, 1] for dy in [-1, 0, 1] if dx != 0 or dy != 0
-            ]
-            random.shuffle(valid_moves)
-            new_pos = self.pos
-
-            # Force return to hive after 5 steps outside, even without nectar
-            if self.steps_outside_hive >= 5:
-                # Calculate direction toward the hive
-                dx = hive_pos[0] - self.pos[0]
-                dy = hive_pos[1] - self.pos[1]
-                move = (0 if dx == 0 else dx // abs(dx), 0 if dy == 0 else dy // abs(dy))
-                new_pos = (self.pos[0] + move[0], self.pos[1] + move[1])
-                # Check if bee has reached the hive
-                if new_pos == hive_pos:
-                    self.inhive = True
-                    self.on_mission = False
-                    self.wait_steps = 4  # Wait 4 timesteps in hive
-                    print(f"{self.id} returned to hive after {self.steps_outside_hive} steps.")
-                    self.steps_outside_hive = 0
-            # Return to hive if carrying nectar
-            elif self.carrying_nectar > 0:
-                # Calculate direction toward the hive
-                dx = hive_pos[0] - self.pos[0]
-                dy = hive_pos[1] - self.pos[1]
-                move = (0 if dx == 0 else dx // abs(dx), 0 if dy == 0 else dy // abs(dy))
-                new_pos = (self.pos[0] + move[0], self.pos[1] + move[1])
-                # Deposit nectar if hive is reached
-                if new_pos == hive_pos:
-                    self.inhive = True
-                    self.on_mission = False
-                    deposited_nectar = self.carrying_nectar
-                    print(f"{self.id} returned to hive with {self.carrying_nectar} nectar.")
-                    self.carrying_nectar = 0
-                    self.wait_steps = 4  # Wait 4 timesteps in hive
-                    self.steps_outside_hive = 0
-                    # Share nectar locations with hive (intelligent strategy)
-                    if strategy_type == 'intelligent' and hive_memory is not None:
-                        for loc in self.known_nectar:
-                            if loc not in hive_memory:
-                                print(f"{self.id} shared nectar location {loc} with the hive.")
-                                hive_memory.append(loc)
-            # Search for nectar if not carrying any
-            else:
-                # Check a 3x3 area around the bee's position for nectar sources
-                x, y = self.pos
-                for dx in [-1, 0, 1]:
-                    for dy in [-1, 0, 1]:
-                        test_pos = (x + dx, y + dy)
-                        # Ensure the test position is within world boundaries
-                        if 0 <= test_pos[0] < len(world) and 0 <= test_pos[1] < len(world[0]):
-                            # Check for flowers at the test position
-                            for flower in flowers:
-                                if flower.position == test_pos:
-                                    nectar = flower.collect_nectar()
-                                    if nectar > 0:
-                                        self.carrying_nectar = nectar
-                                        self.total_nectar += nectar
-                                        # Add flower position to known nectar locations
-                                        if flower.position not in self.known_nectar:
-                                            self.known_nectar.append(flower.position)
-                                        self.target = None  # Clear target after collecting
-                                        break
-                            # Check for trees at the test position
-                            for tree in trees:
-                                if tree.position == test_pos:
-                                    nectar = tree.collect_nectar()
-                                    if nectar > 0:
-                                        self.carrying_nectar = nectar
-                                        self.total_nectar += nectar
-                                        # Add tree position to known nectar locations
-                                        if tree.position not in self.known_nectar:
-                                            self.known_nectar.append(tree.position)
-                                        self.target = None  # Clear target after collecting
-                                    break
-                            # Stop searching if nectar is collected
-                            if self.carrying_nectar > 0:
-                                break
-                        if self.carrying_nectar > 0:
-                            break
-                    if self.carrying_nectar > 0:
-                        break
+            # The step above may have crossed the timeout threshold
+            state = self._state()
+
+            # Search for nectar if not heading home
+            if state is BeeState.OUT_SEARCH:
+                # Check a 3x3 area around the bee's position for nectar
+                # sources, unless the caller already knows none is adjacent
+                if near_source is not False:
+                    self._try_collect(flower_map, tree_map, flags, width, height)
 
                 # Move randomly if no nectar is collected
                 if self.carrying_nectar == 0:
-                    for dx, dy in valid_moves:
-                        test_pos = (self.pos[0] + dx, self.pos[1] + dy)
+                    # Sample offsets from the shared Moore neighborhood; the
+                    # first draw is almost always valid, so a few retries
+                    # beat building and shuffling an 8-element list per step.
+                    # One 9-bit draw covers all three retries (3 bits each)
+                    bits = getrandbits(9)
+                    for _ in range(3):
+                        dx, dy = _MOORE[bits & 7]
+                        bits >>= 3
+                        tx, ty = self.px + dx, self.py + dy
                         # Check if the new position is valid (within bounds, no barriers)
-                        if (0 <= test_pos[0] < len(world) and
-                                0 <= test_pos[1] < len(world[0]) and
-                                not any(b.position == test_pos for b in barriers)):
-                            new_pos = test_pos
+                        if (0 <= tx < width and 0 <= ty < height and
+                                not flags[tx, ty] & BARRIER):
+                            self.px, self.py = tx, ty
                             break  # Take the first valid random move
-
-            # Update position if the new position is valid
-            if (0 <= new_pos[0] < len(world) and
-                    0 <= new_pos[1] < len(world[0]) and
-                    not any(b.position == new_pos for b in barriers)):
-                self.pos = new_pos
+            # Head one step toward the hive, either because nectar is in
+            # hand (OUT_RETURNING) or the mission timed out (OUT_TIMEOUT)
+            else:
+                hive_px, hive_py = hive_pos
+                nx = self.px + _sign(hive_px - self.px)
+                ny = self.py + _sign(hive_py - self.py)
+                # Check if bee has reached the hive (two int compares, no
+                # tuple allocation)
+                if nx == hive_px and ny == hive_py:
+                    self.inhive = True
+                    self.on_mission = False
+                    self.wait_steps = 4  # Wait 4 timesteps in hive
+                    if state is BeeState.OUT_RETURNING:
+                        # Deposit the carried nectar
+                        deposited_nectar = self.carrying_nectar
+                        if log.isEnabledFor(logging.DEBUG):
+                            log.debug(
+                                "%s returned to hive with %d nectar.",
+                                self.id, self.carrying_nectar
+                            )
+                        self.carrying_nectar = 0
+                        # Share nectar locations with hive (intelligent strategy)
+                        if strategy_type == 'intelligent' and hive_memory is not None:
+                            new_locs = set(self.known_nectar) - hive_memory
+                            if new_locs:
+                                if log.isEnabledFor(logging.DEBUG):
+                                    for loc in new_locs:
+                                        log.debug(
+                                            "%s shared nectar location %s with the hive.",
+                                            self.id, loc
+                                        )
+                                hive_memory |= new_locs
+                    elif log.isEnabledFor(logging.DEBUG):
+                        log.debug(
+                            "%s returned to hive after %d steps.",
+                            self.id, self.steps_outside_hive
+                        )
+                    self.steps_outside_hive = 0
+                # The single validation for the hive-bound move
+                if (0 <= nx < width and 0 <= ny < height and
+                        not flags[nx, ny] & BARRIER):
+                    self.px, self.py = nx, ny
 
         return deposited_nectar
 
+    def _state(self) -> BeeState:
+        """Derive the bee's behavioral state from its current flags.
+
+        Keeping the flags authoritative (rather than storing the state)
+        means callers that poke inhive/carrying_nectar directly stay
+        consistent with the dispatch in step_change.
+
+        Returns:
+            BeeState: The state governing this timestep's branch.
+        """
+        if self.inhive:
+            if self.wait_steps > 0:
+                return BeeState.IN_HIVE_WAIT
+            return BeeState.IN_HIVE_IDLE
+        if self.steps_outside_hive >= 5:
+            return BeeState.OUT_TIMEOUT
+        if self.carrying_nectar > 0:
+            return BeeState.OUT_RETURNING
+        return BeeState.OUT_SEARCH
+
+    def _record_collection(self, nectar: int, pos: Tuple[int, int]) -> None:
+        """Record freshly collected nectar and remember where it came from.
+
+        Args:
+            nectar (int): Amount of nectar just collected.
+            pos (Tuple[int, int]): Position of the source it came from.
+        """
+        self.carrying_nectar = nectar
+        self.total_nectar += nectar
+        if pos not in self.known_nectar:
+            self.known_nectar.append(pos)
+        self.target = None  # Clear target after collecting
+
+    def _try_collect(
+        self,
+        flower_map: dict,
+        tree_map: dict,
+        flags: np.ndarray,
+        width: int,
+        height: int
+    ) -> bool:
+        """Collect from the first nectar source in the 3x3 neighborhood.
+
+        Returns as soon as nectar is collected, so no per-cell carrying
+        checks are needed after a success. Note this also tightens the
+        original loop's tree handling: its success break only escaped the
+        innermost level, so a tree collection still walked the remaining
+        (dx, dy) cells before the outer carrying checks noticed. Here a
+        flower or tree hit exits identically and immediately.
+
+        Args:
+            flower_map (dict): Position-keyed flower lookup.
+            tree_map (dict): Position-keyed tree lookup.
+            flags (np.ndarray): Terrain bit-flag grid from build_index.
+            width (int): World width.
+            height (int): World height.
+
+        Returns:
+            bool: True if nectar was collected.
+        """
+        x, y = self.px, self.py
+        # One vectorized test over the clipped 3x3 window settles the
+        # common nothing-nearby case before any per-cell probing
+        window = flags[max(0, x - 1):x + 2, max(0, y - 1):y + 2]
+        if not (window & _SOURCE).any():
+            return False
+        for dx, dy in _MOORE_INCL_CENTER:
+            tx, ty = x + dx, y + dy
+            # Ensure the test position is within world boundaries
+            if not (0 <= tx < width and 0 <= ty < height):
+                continue
+            # One byte read tells whether anything grows here before any
+            # dict lookup happens
+            cell = flags[tx, ty]
+            if not cell & _SOURCE:
+                continue
+            test_pos = (tx, ty)
+            if cell & FLOWER:
+                nectar = flower_map[test_pos].collect_nectar()
+                if nectar > 0:
+                    self._record_collection(nectar, test_pos)
+                    return True
+            if cell & TREE:
+                nectar = tree_map[test_pos].collect_nectar()
+                if nectar > 0:
+                    self._record_collection(nectar, test_pos)
+                    return True
+        return False
+
     def get_pos(self) -> Tuple[int, int]:
         """Get the bee's current position.
 
         Returns:
             Tuple[int, int]: The (x, y) coordinates of the bee.
         """
-        return self.pos
+        return (self.px, self.py)
 
     def get_inhive(self) -> bool:
         """Check if the bee is currently in the hive.